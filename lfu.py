@@ -22,15 +22,16 @@ Solution
 The implementation below has O(1) time complexity for insertion, eviction, and lookup,
 and takes O(maxsize) space.
 
-A doubly-linked list is used for frequency buckets, e.g.
+A dict associates each frequency in use with a frequency bucket ("freqnode"), e.g.
 
-  [0]-[1]-[4]-[7]
+  {0: [0], 1: [1], 4: [4], 7: [7]}
 
-Each frequency bucket also stores a doubly-linked list of key-value nodes with that frequency:
+Each frequency bucket stores the key-value items with that frequency
+in an OrderedDict, least-recently retrieved first:
 
        frequencies
        ^^^^^^^^^^^
-     [0]-[1]-[4]-[7]
+     [0] [1] [4] [7]
       |   |   |   |
  k:  <A> <D> <F> <G>
  e:   |   |       |
@@ -38,119 +39,48 @@ Each frequency bucket also stores a doubly-linked list of key-value nodes with t
  s:   |
      <C>
 
-In this example, A-B-C is the list of all keys with frequency 0,
-D-E is the list of all keys with frequency 1, and so forth.
+In this example, A-B-C are the keys with frequency 0,
+D-E are the keys with frequency 1, and so forth.
 (Values associated with keys are omitted for brevity.)
 
-Each key-value list node ("kvnode") stores a reference back to its frequency list node ("freqnode"),
-so e.g. the nodes for keys D and E each have a reference to the node for frequency 1.
+A backing dict associates each key with its freqnode, so that an item can be moved
+to the next-highest-frequency bucket as a result of a lookup in constant time.
 
-Finally, a backing dict associates keys with kvnodes, so that a kvnode can be moved
-to the next-highest-frequency list as a result of a lookup in constant time.
-Since the least-frequency-used key is always the first item in the frequency list,
+Finally, the lowest frequency with a non-empty bucket is tracked as the cache is updated.
+Since the least-frequently-used key is always the first item in that bucket,
 insertion and eviction are also constant-time.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from types import SimpleNamespace
+from collections import OrderedDict
 import typing as t
 
 
 KT = t.TypeVar("KT")  # key type
 VT = t.TypeVar("VT")  # value type
-DT = t.TypeVar("DT")  # node data type
 
 
-@dataclass
-class KVNodeData(t.Generic[KT, VT]):
-    key: KT
-    val: VT
-    freq_node: FreqNode
+class FreqNode(t.Generic[KT, VT]):
+    """Frequency bucket holding the items with frequency *freq*.
 
+    The repr summarizes the bucket rather than listing its items, so that it stays O(1)
+    even when a debugger or log line reprs every freq node in a large cache:
 
-@dataclass
-class FreqNodeData:
-    freq: int        # frequency
-    kvlhead: KVNode  # head of kvnode list
-
-
-class AnyNodeData(SimpleNamespace):
-    pass
-
-
-class Node(t.Generic[DT]):
-    """Generic doubly-linked list node.
-
-    >>> (head := Node())
-    ()
-    >>> head.unlinked()
-    True
-    >>> head.nxt is head.prv is head
-    True
-    >>> head.insert(Node(x=1))
-    >>> head.unlinked()
-    False
-    >>> head
-    ()(x=1)
-    >>> head.nxt.data.x
-    1
-    >>> head.insert(Node(x=2))
-    >>> head
-    ()(x=2)(x=1)
+    >>> (freq_node := FreqNode(freq=2))
+    FreqNode(freq=2, size=0)
+    >>> freq_node.entries["A"] = "a"
+    >>> freq_node
+    FreqNode(freq=2, size=1)
     """
 
-    data_cls: t.Type[DT] = t.cast(t.Type[DT], AnyNodeData)
-    data: DT
+    __slots__ = ("freq", "entries")
 
-    __slots__ = ("prv", "nxt", "data")
-
-    def __init__(self, **data):
-        """Create a new unlinked Node."""
-        self.prv = self.nxt = self
-        self.data = self.data_cls(**data)
-
-    def unlinked(self) -> bool:
-        return self.nxt is self and self.prv is self
-
-    def unlink(self) -> None:
-        self.prv.nxt = self.nxt
-        self.nxt.prv = self.prv
-        self.nxt = self.prv = self
+    def __init__(self, freq: int):
+        self.freq = freq                                    # frequency
+        self.entries: OrderedDict[KT, VT] = OrderedDict()  # items with this frequency, in LRU order
 
     def __repr__(self) -> str:
-        s = ""
-        cur = start = self
-        while not s or (cur := cur.nxt) is not start:
-            s += str(cur.data).removeprefix(self.data_cls.__name__)
-        return s
-
-    def insert(self, new_nxt: t.Self) -> None:
-        """Insert *new_nxt* in between this node and its current next node."""
-        old_nxt = self.nxt
-        self.nxt = new_nxt
-        new_nxt.prv = self
-        new_nxt.nxt = old_nxt
-        old_nxt.prv = new_nxt
-
-
-class KVNode(Node):
-    data_cls = KVNodeData
-
-    @property
-    def freq(self):
-        return self.data.freq_node.data.freq
-
-
-class FreqNode(Node):
-    data_cls = FreqNodeData
-
-    def __init__(self, freq):
-        kvlhead = KVNode(freq_node=self, key=..., val=...)
-        super().__init__(freq=freq, kvlhead=kvlhead)
-
-    def is_empty(self) -> bool:
-        return self.data.kvlhead.unlinked()
+        return f"{self.__class__.__name__}(freq={self.freq}, size={len(self.entries)})"
 
 
 class LFUCache(t.Generic[KT, VT]):
@@ -168,91 +98,103 @@ class LFUCache(t.Generic[KT, VT]):
 
     def __init__(self, maxsize: int):
         self.maxsize = maxsize
-        self._node_by_key = {}
-        self._freq0_node = FreqNode(freq=0)
+        self._freq_node_by_key: dict[KT, FreqNode[KT, VT]] = {}
+        self._freq0_node: FreqNode[KT, VT] = FreqNode(freq=0)
+        self._freq_nodes: dict[int, FreqNode[KT, VT]] = {0: self._freq0_node}
+        self._min_freq = 0  # lowest frequency with a non-empty bucket
 
     def get(self, key: KT) -> VT:
         """Look up value associated with *key*, and increment the associated frequency.
 
         Raise KeyError if *key* is not in cache.
         """
-        kvnode = self._node_by_key[key]  # raise KeyError if no node with this key
-        target_freq_node = self._get_or_create_inc_freq_node(kvnode)
-        self._move_to_target_freq(kvnode, target_freq_node)
-        return kvnode.data.val
-
-    def _get_or_create_inc_freq_node(self, kvnode: KVNode) -> FreqNode:
-        """Given kvnode with frequency f, get or create the freq node for frequency f + 1."""
-        cur_freq_node = kvnode.data.freq_node
-        target_freq = cur_freq_node.data.freq + 1
-        target_freq_node = cur_freq_node.nxt
-        if target_freq_node.data.freq != target_freq:
-            # need to create the target frequency node
-            target_freq_node = FreqNode(freq=target_freq)
-            cur_freq_node.insert(target_freq_node)
-        return target_freq_node
-
-    def _move_to_target_freq(self, node: KVNode, target_freq_node: FreqNode) -> None:
-        self._unlink(node)
-        node.data.freq_node = target_freq_node
-        target_freq_node.data.kvlhead.insert(node)
-
-    def put(self, key: KT, val: VT, _missing=object()) -> None:
+        freq_node_by_key = self._freq_node_by_key
+        freq_node = freq_node_by_key[key]  # raise KeyError if key not in cache
+        # Move the item to the freq node for the next-highest frequency, creating it if necessary.
+        # (Helpers are inlined here to avoid their call overhead on this hot path.)
+        freq_nodes = self._freq_nodes
+        freq = freq_node.freq
+        target_freq = freq + 1
+        target_freq_node = freq_nodes.get(target_freq)
+        if target_freq_node is None:
+            if len(freq_node.entries) == 1 and freq_node is not self._freq0_node:
+                # The item is alone in its bucket, which would be pruned after the move,
+                # so relabel the bucket with the target frequency instead of creating a new one.
+                del freq_nodes[freq]
+                freq_node.freq = target_freq
+                freq_nodes[target_freq] = freq_node
+                if freq == self._min_freq:
+                    self._min_freq = target_freq
+                return freq_node.entries[key]
+            target_freq_node = freq_nodes[target_freq] = FreqNode(freq=target_freq)
+        val = freq_node.entries.pop(key)
+        target_freq_node.entries[key] = val
+        freq_node_by_key[key] = target_freq_node
+        if not freq_node.entries:
+            if freq == self._min_freq:
+                self._min_freq = target_freq
+            if freq_node is not self._freq0_node:  # see _prune
+                del freq_nodes[freq]
+        return val
+
+    def put(self, key: KT, val: VT) -> None:
         """Insert (key, val) into cache, evicting the LFU item to make room if necessary."""
-        node = self._node_by_key.get(key, _missing)
-        if node is _missing:
-            node = KVNode(freq_node=self._freq0_node, key=key, val=val)
-            self._node_by_key[key] = node
+        freq_node_by_key = self._freq_node_by_key
+        freq0_node = self._freq0_node
+        freq_node = freq_node_by_key.get(key)  # never None for a cached key, so no sentinel is needed
+        if freq_node is None:
+            freq_node_by_key[key] = freq0_node
         else:
-            assert isinstance(node, KVNode)
-            if node.data.val == val:
+            entries = freq_node.entries
+            if entries[key] == val:
                 return  # (key, val) already inserted -> no-op
-            self._unlink(node)
-            node.data.val = val
-            node.data.freq_node = self._freq0_node
-        while len(self) > self.maxsize:  # O(1) (at most 1 iteration) unless maxsize was decreased after init
+            del entries[key]
+            if freq_node is not freq0_node:  # (a freq0 item is just re-added to the same bucket below)
+                if not entries:  # see _prune
+                    del self._freq_nodes[freq_node.freq]
+                freq_node_by_key[key] = freq0_node
+        while len(freq_node_by_key) > self.maxsize:  # O(1) (at most 1 iteration) unless maxsize was decreased after init
             self._evict()
-        self._freq0_node.data.kvlhead.insert(node)
+        freq0_node.entries[key] = val
+        self._min_freq = 0
 
-    def _unlink(self, kvnode: KVNode) -> None:
-        """Remove kvnode and prune its frequency bucket if no longer needed."""
-        kvnode.unlink()
-        freq_node = kvnode.data.freq_node  # Prune associated freq_node if empty...
-        # ...but not if it's the freq0 node, since we need the freq0 node on every put:
-        if freq_node.is_empty() and freq_node is not self._freq0_node:
-            freq_node.unlink()
+    def _prune(self, freq_node: FreqNode) -> None:
+        """Forget *freq_node* if its bucket is empty."""
+        # Don't prune the freq0 node though, since we need the freq0 node on every put:
+        if freq_node is not self._freq0_node and not freq_node.entries:
+            del self._freq_nodes[freq_node.freq]
 
     def _evict(self) -> None:
-        assert self
-        if self._freq0_node.is_empty():      # freq0 node may be empty. If so...
-            lfu_node = self._freq0_node.nxt  # ...lfu_node must be its nxt, since...
-            assert not lfu_node.is_empty()   # ...no other freq nodes may be empty.
-        else:
-            lfu_node = self._freq0_node
-        evict_node = lfu_node.data.kvlhead.prv  # Choose the oldest key in the lfu bucket.
-        assert not evict_node.unlinked()
-        self._unlink(evict_node)
-        del self._node_by_key[evict_node.data.key]
+        # Only called by put while the cache is over maxsize, so there is always an item to evict.
+        lfu_node = self._freq_nodes.get(self._min_freq)
+        if lfu_node is None or not lfu_node.entries:
+            # The lfu bucket was emptied by a previous eviction during this put,
+            # which is only possible if maxsize was decreased after init.
+            self._min_freq = min(f for (f, n) in self._freq_nodes.items() if n.entries)
+            lfu_node = self._freq_nodes[self._min_freq]
+        evict_key, _ = lfu_node.entries.popitem(last=False)  # Choose the oldest key in the lfu bucket.
+        self._prune(lfu_node)
+        del self._freq_node_by_key[evict_key]
 
     def __len__(self) -> int:
-        return len(self._node_by_key)
+        return len(self._freq_node_by_key)
 
     def __contains__(self, key: KT) -> bool:
-        return key in self._node_by_key
+        return key in self._freq_node_by_key
 
     def __iter__(self) -> t.Iterator[KT]:
-        yield from self._node_by_key
+        return iter(self._freq_node_by_key)
 
     def freq(self, key: KT) -> int:
-        return self._node_by_key[key].freq
+        return self._freq_node_by_key[key].freq
 
     def to_mapping(self) -> t.Mapping[KT, VT]:
-        return {k: n.data.val for k, n in self._node_by_key.items()}
+        return {k: n.entries[k] for k, n in self._freq_node_by_key.items()}
 
     def __repr__(self) -> str:
         return f"""{self.__class__.__name__}({{{
-            ", ".join(f"{k}: {n.data.val} [freq={self.freq(k)}]"
-                      for (k, n) in self._node_by_key.items())
+            ", ".join(f"{k}: {n.entries[k]} [freq={n.freq}]"
+                      for (k, n) in self._freq_node_by_key.items())
         }}})"""
 
 